@@ -1,6 +1,11 @@
 # Python imports
+import asyncio
+import concurrent.futures
+import os
 import requests
+import threading
 import time
+import types
 import urllib3
 
 # Third-party imports
@@ -8,11 +13,33 @@ from playwright._impl._api_types import TimeoutError as PwTimeoutError
 from playwright.sync_api import sync_playwright
 
 
+# Scan states in which a scan cannot be (re)started
+_INVALID_SCAN_STATES = frozenset({
+    'running', 'stopping', 'imported', 'pausing', 'paused', 'pending',
+    'resuming'})
+
+# Export formats accepted by the /scans/{id}/export resource
+_EXPORT_FORMATS = frozenset({'nessus', 'html', 'pdf', 'csv', 'db'})
+
+# Browser resource types the dirty hacks never need
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+
 class ElementNotVisibleError(Exception):
     """HTML element is not found."""
     pass
 
 
+class NessusError(Exception):
+    """A Nessus operation could not be completed.
+
+    Raised instead of exiting the process so long-running automations can
+    catch the failure and retry while keeping the HTTP connection pool and
+    the browser alive.
+    """
+    pass
+
+
 def assert_valid_http_response(
         response, url, expected_status=200, expecting_json=True):
     """Helper method to assert an HTTP response object is valid.
@@ -22,21 +49,25 @@ def assert_valid_http_response(
     :param url: The URL used to make the request. This is used for logging.
     :param expected_status: The expected status code of the response.
     :param expecting_json: Whether we are expecting json in the response.
+    :return: The decoded response JSON if expecting_json, otherwise None.
+             Callers should reuse this rather than calling response.json()
+             again, so large payloads are only decoded once.
     """
     code = response.status_code
     print(f'Asserting valid HTTP response from {url}')
     if code != expected_status:
-        print(f'Aborting: expected status code {expected_status} not {code}')
         print('Raw response:')
         print(response.text)
-        exit()
+        raise NessusError(
+            f'Expected status code {expected_status} from {url}, not {code}')
 
     if expecting_json:
         try:
-            response.json()
+            return response.json()
         except:
-            print('Aborting: Unable to find/decode response JSON')
-            exit()
+            raise NessusError(
+                f'Unable to find/decode response JSON from {url}')
+    return None
 
 
 def block_until_element_is_visible(playwright_page, locator_str, timeout=5):
@@ -47,23 +78,18 @@ def block_until_element_is_visible(playwright_page, locator_str, timeout=5):
     :param locator_string: String used to locate the element to wait for.
     :param timeout: How long to wait for element to become visible in seconds.
     """
-    retries = timeout
-
-    # Locator object can hang; reload it each time before calling wait_for
-    while retries > 0:
-        try:
-            element = playwright_page.locator(locator_str)
-            # One second timeout
-            element.wait_for(timeout=1000, state='visible')
-            return
-        except PwTimeoutError:
-            retries -= 1
-    raise ElementNotVisibleError(f'Unable to locate "{locator_str}"')
+    # wait_for polls internally, so one call with the full timeout is faster
+    # and more reliable than re-locating the element every second
+    try:
+        element = playwright_page.locator(locator_str)
+        element.wait_for(timeout=timeout*1000, state='visible')
+    except PwTimeoutError:
+        raise ElementNotVisibleError(f'Unable to locate "{locator_str}"')
 
 
 class NessusEssentialssWebInterface(object):
     def __init__(
-            self, url, username, password, context_manager, headless=False):
+            self, url, username, password, context_manager, headless=True):
         """Helper class to separate web dirty hacks from Rest API calls.
 
         :param url: The base URL of the Nessus host.
@@ -78,24 +104,45 @@ class NessusEssentialssWebInterface(object):
         self.username = username
         self.password = password
 
-        # Session instance variables for dirty hacks
-        self.browser = context_manager.chromium.launch(headless=headless)
-        context = self.browser.new_context(**{'ignore_https_errors': True})
+        # Launching Chromium costs seconds and hundreds of MB, and the happy
+        # path never needs it, so defer the launch until a dirty hack fires
+        self._cm = context_manager
+        self._headless = headless
+        self.browser = None
+        self.page = None
+
+        # Cookies persisted here survive process restarts so consecutive
+        # runs can skip the login form entirely
+        self._context = None
+        self._storage_state_path = 'nessus_state.json'
+
+    def _ensure_browser(self):
+        """Launch the browser and open a page on first dirty-hack use."""
+        if self.browser is not None:
+            return
+        self.browser = self._cm.chromium.launch(headless=self._headless)
+        context_args = {'ignore_https_errors': True}
+        if os.path.exists(self._storage_state_path):
+            context_args['storage_state'] = self._storage_state_path
+        context = self.browser.new_context(**context_args)
+
+        # The dirty hacks only touch form and button DOM nodes, so skip
+        # images, fonts, media, and stylesheets to cut page-load time
+        context.route(
+            '**/*',
+            lambda route: route.abort()
+            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+            else route.continue_())
+        self._context = context
         self.page = context.new_page()
 
     def _assert_scan_exists(self, scan_name):
         """Helper method to assert that a scan exists before operating on it.
 
-        This function will print an error message and exit the program if the
-        scan in question is not found.
-
         :param scan_name: The name of the scan to assert exists.
+        :raises NessusError: If the scan in question is not found.
         """
-        for scan in self.get_on_demand_scans():
-            if scan['name'] == scan_name:
-                return
-        print(f'Aborting: Unable to locate the scan {scan_name}')
-        exit()
+        self._scan_by_name(scan_name)
 
     def _login_web_interface(self, resource='/#/scans/folders/all-scans'):
         """Login to Nessus using the web credentials passed to __init__.
@@ -106,26 +153,37 @@ class NessusEssentialssWebInterface(object):
         :param resource: The resource to navigate to after logging in.
         """
         print('Attempting to login to the Nessus web interface')
+        self._ensure_browser()
 
-        # Assert location is valid before trying to open it
+        # The browser's own fetch tells us whether the location is valid, so
+        # no separate pre-flight request is needed. goto returns None for a
+        # same-document navigation (e.g. hopping between /#/... fragment
+        # routes on a page that is already open), which is a success
         location = self._url + resource
-        response = requests.get(location, verify=False)
-        assert_valid_http_response(response, location, expecting_json=False)
-        self.page.goto(location)
+        response = self.page.goto(location)
+        if response is not None and not response.ok:
+            raise NessusError(
+                f'Bad response {response.status} from {location}')
+
+        # If the login form never renders, the context's cookies still hold
+        # a valid session and we can skip the credential round-trip
+        try:
+            self.page.wait_for_selector('.login-username', timeout=1500)
+        except PwTimeoutError:
+            print('Already logged in to the Nessus web interface')
+            return
 
         try:
-            block_until_element_is_visible(self.page, '.login-username')
             self.page.fill('.login-username', self.username)
             self.page.fill('.login-password', self.password)
-            block_until_element_is_visible(self.page, 'text=Sign In')
-            self.page.click('text=Sign In')
-        except ElementNotVisibleError:
-            # TODO: (check this) Probably already logged in
+            # click auto-waits for the button, no separate visibility wait
+            self.page.locator('text=Sign In').click(timeout=5000)
+        except PwTimeoutError:
             print('Unable to login to the Nessus web interface')
             return
         print('Successfully logged in to the Nessus web interface')
 
-    def _start_scan_web_interface(self, scan_name, folder_name, targets=[]):
+    def _start_scan_web_interface(self, scan_name, folder_name, targets=None):
         """Start a scan from the Nessus web interface.
 
         Note: This is used as a last resort for dirty hacks to work around
@@ -135,7 +193,10 @@ class NessusEssentialssWebInterface(object):
         :param folder_name: The name of the folder the scan lives in.
         :param targets: Optionally, scan listed targets rather than default.
         """
+        if targets is None:
+            targets = []
         self._assert_scan_exists(scan_name)
+        self._ensure_browser()
 
         # Folder names must be lowercase with hyphens in places of spaces
         folder_name = folder_name.lower().replace(' ', '-')
@@ -143,37 +204,42 @@ class NessusEssentialssWebInterface(object):
         self._login_web_interface(resource=scan_folder_location)
 
         try:
-            block_until_element_is_visible(self.page, f'text={scan_name}')
-            self.page.click(f'text={scan_name}')
-        except ElementNotVisibleError:
+            self.page.locator(f'text={scan_name}').click(timeout=5000)
+        except PwTimeoutError:
             print(f'FATAL: failed to start the scan "{scan_name}".')
             return
 
-        # Manually start the scan from the Nessus web interface
-        block_until_element_is_visible(self.page, '#launch-dropdown')
-        self.page.click('text=Launch')
+        # Manually start the scan from the Nessus web interface. Each click
+        # auto-waits for its own element, and the intermediate clicks do not
+        # navigate, so skip their post-click waits
+        self.page.locator('text=Launch').click(
+            timeout=5000, no_wait_after=True)
 
         if len(targets) == 0:
-            self.page.click('text=Default')
+            self.page.locator('text=Default').click(timeout=5000)
         else:
-            self.page.click('text=Custom')
-
-            target_str = ''
-            for target in targets:
-                target_str += target + ', '
-            target_str = target_str[:-2]  # Truncate the last adjunct ', '
-
-            self.page.fill('#custom-launch-targets', target_str)
+            self.page.locator('text=Custom').click(
+                timeout=5000, no_wait_after=True)
+            self.page.fill('#custom-launch-targets', ', '.join(targets))
             self.page.click('#custom-targets-launch')
 
-        time.sleep(10)  # Wait for scan to start
+        # Wait for the scan row to show as running rather than sleeping an
+        # unconditional 10 seconds; fall back to the page settling if the
+        # status badge never renders
+        try:
+            block_until_element_is_visible(
+                self.page,
+                f'.scan-row[data-name="{scan_name}"] .status-running',
+                timeout=15)
+        except ElementNotVisibleError:
+            self.page.wait_for_load_state('networkidle')
         print('Scan started successfully')
 
 
 class NessusEssentials(NessusEssentialssWebInterface):
     def __init__(
             self, url, username, password, api_access_key, api_secret_key,
-            context_manager, headless=False):
+            context_manager, headless=True):
         """Nessus object for managing and polling scans.
 
         Generating Rest API keys:
@@ -200,13 +266,140 @@ class NessusEssentials(NessusEssentialssWebInterface):
         """
         super().__init__(url, username, password, context_manager, headless)
 
-        # Rest API authentication
+        # Rest API authentication. The headers live on the session, so the
+        # canonical dict is read-only to keep callers from mutating it
         api_auth = f'accessKey={api_access_key}; secretKey={api_secret_key}'
-        self._default_headers = {
+        self._default_headers = types.MappingProxyType({
             'Content-Type': 'application/json',
             'User-Agent': 'pyscan/1.0',
             'X-ApiKeys': api_auth
-        }
+        })
+
+        # We talk to Nessus with verify=False throughout, so silence the
+        # insecure-request warnings for library users too
+        urllib3.disable_warnings()
+
+        # Reuse one keep-alive connection pool so every request does not pay
+        # for a fresh TCP+TLS handshake to the Nessus host
+        self._session = requests.Session()
+        self._session.headers.update(self._default_headers)
+        self._session.verify = False
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=20)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # Short-lived cache of the /scans payload so one logical poll does
+        # not fan out into several identical HTTP requests. The thread pool
+        # polls this cache concurrently, so reads and refreshes are guarded
+        # by a reentrant lock; holding it across the refetch also stops a
+        # poll burst from issuing duplicate /scans requests
+        self._scans_lock = threading.RLock()
+        self._scans_cache = None
+        self._scans_cache_ts = 0.0
+        self._scans_ttl = 3.0
+        self._scans_by_name_cache = None
+
+        # Thread pool for overlapping requests to independent endpoints over
+        # the shared connection pool
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+    def close(self):
+        """Close the HTTP connection pool and the web browser."""
+        self._executor.shutdown()
+        self._session.close()
+        if self.browser is not None:
+            # Persist cookies so the next run can skip the login form. The
+            # file holds live session cookies, so keep it owner-only
+            self._context.storage_state(path=self._storage_state_path)
+            os.chmod(self._storage_state_path, 0o600)
+            self.browser.close()
+
+    def _fetch_scans_payload(self):
+        """Fetch and parse the /scans Rest API resource.
+
+        The /scans resource returns both the scan list and the folder list,
+        so both get_scan_folders and get_on_demand_scans are derived from a
+        single call to this method rather than each issuing its own request.
+
+        :return: The parsed JSON payload of the /scans resource.
+        """
+        url = self._url + '/scans'
+        resp = self._session.get(url)
+        return assert_valid_http_response(resp, url)
+
+    def _fetch_resources_concurrently(self, resources):
+        """Fetch several Rest API resources in parallel over the session.
+
+        The requests share the pooled session, so the per-request cost is
+        only the server's own query time and the round-trips overlap instead
+        of adding up. Use this when a method needs several independent
+        endpoints at once.
+
+        :param resources: List of resource paths, e.g. ['/scans', '/folders'].
+        :return: List of parsed JSON payloads in the same order as resources.
+        """
+        futures = [
+            self._executor.submit(self._session.get, self._url + resource)
+            for resource in resources]
+        return [
+            assert_valid_http_response(future.result(), self._url + resource)
+            for future, resource in zip(futures, resources)]
+
+    def _get_scans_cached(self):
+        """Return the /scans payload, refetching only when the cache is stale.
+
+        Polling helpers such as block_until_scan_completes look up the scan
+        list several times per tick; serving those lookups from a cache with
+        a few seconds of TTL collapses them into one HTTP request.
+
+        :return: The parsed JSON payload of the /scans resource.
+        """
+        with self._scans_lock:
+            if (self._scans_cache is None
+                    or time.monotonic() - self._scans_cache_ts
+                    >= self._scans_ttl):
+                self._scans_cache = self._fetch_scans_payload()
+                self._scans_cache_ts = time.monotonic()
+                self._scans_by_name_cache = None
+            return self._scans_cache
+
+    def invalidate_cache(self):
+        """Drop the cached /scans payload so the next lookup refetches it."""
+        with self._scans_lock:
+            self._scans_cache = None
+            self._scans_cache_ts = 0.0
+            self._scans_by_name_cache = None
+
+    def _scans_by_name(self):
+        """Return a name-to-scan dict derived from the cached scan list.
+
+        Built once per cache refresh so the polling helpers can resolve a
+        scan in O(1) instead of walking the full scan list on every lookup.
+
+        :return: Dictionary mapping each scan name to its information
+                 dictionary as returned by get_on_demand_scans.
+        """
+        with self._scans_lock:
+            self._get_scans_cached()  # Refresh stale data, drop derived dict
+            by_name = self._scans_by_name_cache
+            if by_name is None:
+                by_name = {
+                    scan['name']: scan for scan in self.get_on_demand_scans()}
+                self._scans_by_name_cache = by_name
+            return by_name
+
+    def _scan_by_name(self, scan_name):
+        """Look up a single scan's information dictionary by name.
+
+        :param scan_name: The name of the scan to look up.
+        :return: The scan's information dictionary.
+        :raises NessusError: If the scan does not exist.
+        """
+        scan = self._scans_by_name().get(scan_name)
+        if scan is None:
+            raise NessusError(f'Unable to locate the scan {scan_name}')
+        return scan
 
     def get_scan_folders(self):
         """Get a list of scan folder names and their IDs.
@@ -218,11 +411,7 @@ class NessusEssentials(NessusEssentialssWebInterface):
         :return: List of dictionaries of scan names and their corresponding
                  folder IDs.
         """
-        url = self._url + '/scans'
-        resp = requests.get(url, headers=self._default_headers, verify=False)
-        assert_valid_http_response(resp, url)
-
-        folders = resp.json()
+        folders = self._get_scans_cached()
         return [{
             'name': folder['name'],
             'id': folder['id']
@@ -247,89 +436,117 @@ class NessusEssentials(NessusEssentialssWebInterface):
         :return: A list of dictionaries of each scan, its name, folder id, and
                  its id.
         """
-        url = self._url + '/scans'
-        resp = requests.get(url, headers=self._default_headers, verify=False)
-        assert_valid_http_response(resp, url)
+        scans = self._get_scans_cached()
 
-        scans = resp.json()
-        scan_dict = [{
+        # The scan folder name is needed for dirty hacks; one dict lookup
+        # per scan beats re-walking the folder list for every scan
+        folder_by_id = {
+            folder['id']: folder['name'] for folder in scans['folders']}
+        return [{
             'name': scan['name'],
             'id': scan['id'],
             'folder_id': scan['folder_id'],
-            'status': scan['status']
+            'status': scan['status'],
+            'folder_name': folder_by_id.get(scan['folder_id'])
         } for scan in scans['scans']]
 
-        # Now we get the scan folder name for dirty hacks
-        for scan in scan_dict:
-            folder_id = scan['folder_id']
-
-            for folder in self.get_scan_folders():
-                if folder['id'] == folder_id:
-                    scan.update({'folder_name': folder['name']})
-                    break
-        return scan_dict
-
     def get_scan_status(self, scan_name: str) -> str:
         """Get the status of a scan.
 
         :param scan_name: The name of the scan to get the status of.
         :return: The current status of the scan.
         """
-        self._assert_scan_exists(scan_name)
-        for scan in self.get_on_demand_scans():
-            if scan['name'] == scan_name:
-                return scan['status']
+        return self._scan_by_name(scan_name)['status']
 
     def get_scan_information(self, scan_name):
         """Get a specific scan's information from self.get_on_demand_scans
 
         :param scan_name: The name of the scan's information to retrieve.
-        :return: Dictionary of the scan's information, or None if scan does not
-                 exist.
+        :return: Dictionary of the scan's information.
+        :raises NessusError: If the scan does not exist.
         """
-        self._assert_scan_exists(scan_name)
-        for scan in self.get_on_demand_scans():
-            if scan['name'] == scan_name:
-                return scan
+        return self._scan_by_name(scan_name)
 
-    def block_until_scan_completes(self, scan_name, timeout=360, interval=5):
-        """Block script execution until scan completes.
+    async def _poll_scan_status(self, scan_name):
+        """Fetch a scan's status without blocking the event loop.
+
+        The blocking HTTP call runs on the thread pool over the shared
+        session, so the event loop stays free to supervise other scans.
+
+        :param scan_name: The name of the scan to get the status of.
+        :return: The current status of the scan.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.get_scan_status, scan_name)
+
+    async def block_until_scan_completes_async(
+            self, scan_name, timeout=360, interval=5):
+        """Asynchronously block until a scan completes.
+
+        Waits are cooperative (asyncio.sleep), so a single event loop can
+        supervise many scans at once:
+
+            >>> await asyncio.gather(
+            ...     nessus.block_until_scan_completes_async('scan_1'),
+            ...     nessus.block_until_scan_completes_async('scan_2'))
 
         :param scan_name: The scan to block execution on.
         :param timeout: Maximum time to block execution for in minutes.
         :param interval: How often to check the scan status in minutes.
         :return: True if scan completes within timeout, False otherwise.
         """
-        self._assert_scan_exists(scan_name)
-        scan_status = self.get_scan_status(scan_name)
+        scan_status = await self._poll_scan_status(scan_name)
 
-        # First, we wait until the scan starts running. Timeout is 15 minutes
+        # First, we wait until the scan starts running. Timeout is 15 minutes.
+        # Poll quickly at first and double the check interval up to a cap so
+        # fast launches are noticed without hammering slow ones
         start_running_timeout = 900
+        check = 5
         while scan_status != 'running':
-            if start_running_timeout == 0:
-                print('ERROR: Scan unable to start')
-                exit()
-            print(f'Waiting for "{scan_name}" to start, sleeping 15 seconds')
-            time.sleep(15)
-            start_running_timeout -= 15
-            scan_status = self.get_scan_status(scan_name)
-
-        # Block until the scan finishes or aborts
-        time_left = timeout
+            if start_running_timeout <= 0:
+                raise NessusError(f'Scan "{scan_name}" was unable to start')
+            print(f'Waiting for "{scan_name}" to start, sleeping '
+                  f'{check} seconds')
+            await asyncio.sleep(check)
+            start_running_timeout -= check
+            check = min(check*2, 60)
+            scan_status = await self._poll_scan_status(scan_name)
+
+        # Block until the scan finishes or aborts, with the same doubling
+        # check interval capped at the caller's polling interval
+        time_left = timeout*60
+        check = 10
+        cap = interval*60
         while scan_status == 'running':
-            if timeout == 0:
-                print('ERROR: Scann timed out')
+            if time_left <= 0:
+                print('ERROR: Scan timed out')
                 return False
 
-            print(f'"{scan_name}" is running, sleeping {interval} minutes')
-            time.sleep(interval*60)
-            time_left -= interval
-            scan_status = self.get_scan_status(scan_name)
+            print(f'"{scan_name}" is running, sleeping {check} seconds')
+            await asyncio.sleep(check)
+            time_left -= check
+            check = min(check*2, cap)
+            scan_status = await self._poll_scan_status(scan_name)
 
         print('Scan completed successfully')
         return True
 
-    def start_scan(self, scan_name, targets=[]):
+    def block_until_scan_completes(self, scan_name, timeout=360, interval=5):
+        """Block script execution until scan completes.
+
+        Synchronous wrapper around block_until_scan_completes_async for
+        callers supervising a single scan.
+
+        :param scan_name: The scan to block execution on.
+        :param timeout: Maximum time to block execution for in minutes.
+        :param interval: How often to check the scan status in minutes.
+        :return: True if scan completes within timeout, False otherwise.
+        """
+        return asyncio.run(self.block_until_scan_completes_async(
+            scan_name, timeout, interval))
+
+    def start_scan(self, scan_name, targets=None):
         """Start a Nessus scan.
 
         Note: This endpoint is only available on Nessus Manager, we use
@@ -338,41 +555,40 @@ class NessusEssentials(NessusEssentialssWebInterface):
         :param scan_name: The name of the scan to start.
         :param targets: The target IP address(es) to pass to the scan.
         """
-        self._assert_scan_exists(scan_name)
-        invalid_scan_states = [
-            'running', 'stopping', 'imported', 'pausing', 'paused', 'pending',
-            'resuming']
-        curr_state = self.get_scan_status(scan_name)
-        if curr_state in invalid_scan_states:
-            print(f'Cannot start scan: {scan_name} currently in {curr_state}')
-            exit()
+        if targets is None:
+            targets = []
 
-        scan_id = self.get_scan_information(scan_name)['id']
-        url = self._url + f'/scans/{scan_id}/launch'
+        # One lookup gives us existence, status, id, and folder name at once
+        scan = self._scan_by_name(scan_name)
+        curr_state = scan['status']
+        if curr_state in _INVALID_SCAN_STATES:
+            raise NessusError(
+                f'Cannot start scan: {scan_name} currently in {curr_state}')
+
+        url = self._url + '/scans/{}/launch'.format(scan['id'])
         if len(targets) == 0:
-            resp = requests.post(
-                url, headers=self._default_headers, verify=False)
+            resp = self._session.post(url)
         else:
-            resp = requests.post(
-                url, headers=self._default_headers, data={'targets': targets},
-                verify=False)
+            resp = self._session.post(url, json={'targets': targets})
 
         # Do not call assert_valid_http_response because API may return 200
         # or 412. In the case of a 412 code, we try our dirty hacks
         if resp.status_code == 200:
+            # Drop the cached scan list so the new status is seen promptly
+            self.invalidate_cache()
             print('Scan started successfully')
         elif resp.status_code == 412:
             # If error response, we are probably not running Nessus Manager
             print('/scans/{id}/launch is only available on Nessus manager.')
             print('Attempting dirty hack to work around this feature lock')
 
-            scan_dict = self.get_scan_information(scan_name)
             self._start_scan_web_interface(
-                scan_name, scan_dict['folder_name'], targets)
+                scan_name, scan['folder_name'], targets)
+            self.invalidate_cache()
         else:
-            print(f'Unexpected error when trying to start"{scan_name}"')
-            print(f'return code from {url} was {resp.status_code}')
-            exit()
+            raise NessusError(
+                f'Unexpected error when trying to start "{scan_name}": '
+                f'return code from {url} was {resp.status_code}')
 
     def export_scan(self, scan_name, format='nessus', file_name='export'):
         """Export a Nessus scan.
@@ -384,7 +600,7 @@ class NessusEssentials(NessusEssentialssWebInterface):
         :param file_name: What to name the export file.
         """
         self._assert_scan_exists(scan_name)
-        if format not in ('nessus', 'html', 'pdf', 'csv', 'db'):
+        if format not in _EXPORT_FORMATS:
             print(f'"{format}" is an invalid export format...')
             print('was expecting one of ["nessus":"html":"pdf":"csv":"db"]')
 
@@ -398,12 +614,11 @@ class NessusEssentials(NessusEssentialssWebInterface):
         data += '}'
 
         print(f'Attempting to export and download {scan_name}')
-        resp = requests.post(
-            url, data.encode(), headers=self._default_headers, verify=False)
-        assert_valid_http_response(resp, url, expecting_json=True)
+        resp = self._session.post(url, data.encode())
+        export = assert_valid_http_response(resp, url, expecting_json=True)
 
-        file_id = resp.json()['file']
-        print('Attempting to download "{}"'.format(resp.json()))
+        file_id = export['file']
+        print('Attempting to download "{}"'.format(export))
 
         download_url = self._url + f'/scans/{scan_id}/export/{file_id}/download'
         status_code = 409  # Report is being generated
@@ -412,10 +627,8 @@ class NessusEssentials(NessusEssentialssWebInterface):
         # Will block for up to half an hour while report is being generated
         while status_code == 409:
             if timeout == 0:
-                print('Aborting: Export request timeout.')
-                exit()
-            resp = requests.get(
-                download_url, headers=self._default_headers, verify=False)
+                raise NessusError(f'Export request for "{scan_name}" timed out')
+            resp = self._session.get(download_url)
             status_code = resp.status_code
             time.sleep(5)  # Poll every 5 seconds
             timeout -= 5
@@ -431,8 +644,6 @@ class NessusEssentials(NessusEssentialssWebInterface):
 # Your code goes below this line #
 ##################################
 if __name__ == '__main__':
-    urllib3.disable_warnings()
-
     # Initialize global variables
     url = "<URL to Nessus web interface>"
     username = "<Nessus web interface username>"